@@ -2,8 +2,8 @@ import abc
 import functools
 import inspect
 import logging
-from typing import Any, Callable, Generic, Iterable, List, MutableMapping, Optional, Set, Type, TypeVar, Union, \
-    overload, Tuple
+from typing import Any, Callable, Dict, Generic, Iterable, List, MutableMapping, Optional, Set, Type, TypeVar, \
+    Union, overload, Tuple
 
 from . import typeinspect
 
@@ -187,11 +187,14 @@ def _get_complex_converters(target: Type) -> Tuple[ComplexConverterABC]:
     return tuple(c for c in reversed(_COMPLEX_CONVERTERS) if c.can_convert(target))
 
 
+@functools.lru_cache(maxsize=None)
 def get_converters(target: Type) -> Iterable[ConverterType]:
     """Get the converters for the given target type.
 
     Complex converters are only returned if no other converter could be found,
     The converters are ordered in the reverse order of their registration.
+
+    The resolved tuple is cached until the converter registry changes.
     """
     # iterate in reverse because we want custom converters to override built-ins
     try:
@@ -200,12 +203,55 @@ def get_converters(target: Type) -> Iterable[ConverterType]:
         return _get_complex_converters(target)
 
 
+# primitive types whose default converter is the constructor itself, these
+# can be called directly without the dispatch loop.
+_PRIMITIVE_TYPES = (bool, int, float, complex, str, bytes)
+
+_primitive_fast: Dict[type, Callable] = {}
+_primitive_fast_valid = False
+
+
+def _get_primitive_fast() -> Dict[type, Callable]:
+    global _primitive_fast_valid
+
+    if not _primitive_fast_valid:
+        _primitive_fast.clear()
+        for typ in _PRIMITIVE_TYPES:
+            # only usable while the default registration is untouched,
+            # custom converters must go through the regular dispatch.
+            if _CONVERTERS.get(typ) == [typ]:
+                _primitive_fast[typ] = typ
+
+        _primitive_fast_valid = True
+
+    return _primitive_fast
+
+
+# converters that repeatedly succeeded for a (value type, target) pair.
+# Once a pair has been seen often enough the winning converter is tried
+# first, skipping the chain walk; a miss falls back to the full dispatch.
+_HOT_CONVERTERS: Dict[Tuple[type, Any], ConverterType] = {}
+_HOT_COUNTS: Dict[Tuple[type, Any], int] = {}
+_HOT_THRESHOLD = 3
+
+
 def _clear_converter_cache() -> None:
+    global _primitive_fast_valid
+
     _get_complex_converters.cache_clear()
+    get_converters.cache_clear()
+    has_converter.cache_clear()
+    _primitive_fast_valid = False
+    _HOT_CONVERTERS.clear()
+    _HOT_COUNTS.clear()
 
 
+@functools.lru_cache(maxsize=None)
 def has_converter(target: Type) -> bool:
-    """Check whether the given target type has a converter."""
+    """Check whether the given target type has a converter.
+
+    The result is cached until the converter registry changes.
+    """
     try:
         next(iter(get_converters(target)))
     except StopIteration:
@@ -274,6 +320,35 @@ def convert_value(value: Any, target: Type[T], *, exclude_converters: Set[Conver
     Raises:
         ConversionError: If the conversion failed.
     """
+    if exclude_converters is None:
+        fast = _get_primitive_fast().get(target)
+        if fast is not None:
+            # values that already are exactly the target type can be
+            # returned without even calling the constructor.
+            if type(value) is target:
+                return value
+
+            try:
+                return fast(value)
+            except Exception as e:
+                raise ConversionError(f"Couldn't convert {value!r} to "
+                                      f"{typeinspect.friendly_name(target)} using {fast}") from e
+
+    hot_key: Optional[Tuple[type, Any]] = None
+    if exclude_converters is None:
+        try:
+            hot_key = (value.__class__, target)
+            hot = _HOT_CONVERTERS.get(hot_key)
+        except TypeError:
+            hot_key = None
+        else:
+            if hot is not None:
+                try:
+                    return _call_converter(hot, value, target)
+                except ConversionError:
+                    # fall back to the full dispatch below
+                    pass
+
     converters = get_converters(target)
 
     last_exception: Optional[Exception] = None
@@ -289,6 +364,14 @@ def convert_value(value: Any, target: Type[T], *, exclude_converters: Set[Conver
 
             last_exception = e
         else:
+            if hot_key is not None:
+                count = _HOT_COUNTS.get(hot_key, 0) + 1
+                if count >= _HOT_THRESHOLD:
+                    _HOT_CONVERTERS[hot_key] = c
+                    _HOT_COUNTS.pop(hot_key, None)
+                else:
+                    _HOT_COUNTS[hot_key] = count
+
             return converted
 
     # if we already have the correct type then just move on
@@ -125,13 +125,36 @@ class UnionConverter(ComplexConverterABC):
     tries to convert to the values from first to last.
     """
 
+    def __init__(self) -> None:
+        self._exact_types: Dict[type, frozenset] = {}
+
+    def _get_exact_types(self, target: type) -> frozenset:
+        try:
+            return self._exact_types[target]
+        except KeyError:
+            types = frozenset(t for t in typeinspect.get_type_args(target) if inspect.isclass(t))
+            self._exact_types[target] = types
+            return types
+
     def can_convert(self, target: type) -> bool:
         return typeinspect.is_union(target) and all(map(has_converter, typeinspect.get_type_args(target)))
 
     def convert(self, value: Any, target: type) -> Any:
+        # exact-type members are by far the most common hit, check them
+        # with a single set probe before the structural walk.
+        if type(value) in self._get_exact_types(target):
+            return value
+
         if typeinspect.has_type(value, target):
             return value
 
+        # The walk below must stay exception-driven and strictly in member
+        # order: whether a member accepts a value can depend on the value
+        # itself (int takes 5.0 but not float("nan")), so neither the
+        # winning member nor a per-class predicate can be cached without
+        # breaking the documented first-to-last preference. Values that
+        # already are in the union never reach this point, the fast paths
+        # above return them without raising.
         types = typeinspect.get_type_args(target)
         last_exception: Optional[Exception] = None
 
@@ -167,7 +190,25 @@ class TupleConverter(ComplexConverterABC):
         item_types = typeinspect.resolve_tuple(target)[0]
         return has_converter(container_type) and all(map(has_converter, item_types))
 
+    @staticmethod
+    def _exact_match(value: tuple, target: type) -> bool:
+        # exact types only, an isinstance check would let values skip
+        # normalising converters (bool passing as int, for instance).
+        types, n = typeinspect.resolve_tuple(target)
+        if n is None:
+            typ = types[0]
+            return inspect.isclass(typ) and all(type(val) is typ for val in value)
+        elif n != len(value):
+            return False
+        else:
+            return all(inspect.isclass(typ) and type(val) is typ for val, typ in zip(value, types))
+
     def convert(self, value: Any, target: type) -> tuple:
+        # tuples whose elements already have the exact item types can be
+        # returned as-is, they're immutable so sharing them is safe.
+        if isinstance(value, tuple) and self._exact_match(value, target):
+            return value
+
         # convert to a collection
         values = convert_value(value, list)
 
@@ -207,17 +248,22 @@ class IterableConverter(ComplexConverterABC):
         container_type = typeinspect.get_origin(target)
         item_type = typeinspect.get_type_args(target)[0]
 
-        final_list = []
-
         it = convert_value(value, Iterable)
-        for i, sub_value in enumerate(it):
-            try:
-                v = convert_value(sub_value, item_type)
-            except ConversionError as e:
-                raise ConversionError(f"couldn't convert value at index {i} ({sub_value!r}) "
-                                      f"to {typeinspect.friendly_name(item_type)}") from e
+        values = it if isinstance(it, (list, tuple)) else list(it)
 
-            final_list.append(v)
+        try:
+            # happy path without per-element exception bookkeeping
+            final_list = [convert_value(sub_value, item_type) for sub_value in values]
+        except ConversionError:
+            # redo slowly to report which element failed
+            for i, sub_value in enumerate(values):
+                try:
+                    convert_value(sub_value, item_type)
+                except ConversionError as e:
+                    raise ConversionError(f"couldn't convert value at index {i} ({sub_value!r}) "
+                                          f"to {typeinspect.friendly_name(item_type)}") from e
+
+            raise
 
         if container_type is not None:
             final_list = convert_value(final_list, container_type, exclude_converters={self})
@@ -252,23 +298,28 @@ class MappingConverter(ComplexConverterABC):
         container_type = typeinspect.get_origin(target)
         key_type, value_type = typeinspect.get_type_args(target)
 
-        final_map = {}
-
         mapping = convert_value(value, Mapping)
-        for key, value in mapping.items():
-            try:
-                k = convert_value(key, key_type)
-            except ConversionError as e:
-                raise ConversionError(f"couldn't convert key {key!r} to "
-                                      f"{typeinspect.friendly_name(key_type)}") from e
-
-            try:
-                v = convert_value(value, value_type)
-            except ConversionError as e:
-                raise ConversionError(f"couldn't convert value of {key!r} ({value!r}) "
-                                      f"to {typeinspect.friendly_name(value_type)}") from e
 
-            final_map[k] = v
+        try:
+            # happy path without per-entry exception bookkeeping
+            final_map = {convert_value(key, key_type): convert_value(val, value_type)
+                         for key, val in mapping.items()}
+        except ConversionError:
+            # redo slowly to report which entry failed
+            for key, val in mapping.items():
+                try:
+                    convert_value(key, key_type)
+                except ConversionError as e:
+                    raise ConversionError(f"couldn't convert key {key!r} to "
+                                          f"{typeinspect.friendly_name(key_type)}") from e
+
+                try:
+                    convert_value(val, value_type)
+                except ConversionError as e:
+                    raise ConversionError(f"couldn't convert value of {key!r} ({val!r}) "
+                                          f"to {typeinspect.friendly_name(value_type)}") from e
+
+            raise
 
         if container_type is not None:
             final_map = convert_value(final_map, container_type, exclude_converters={self})
@@ -311,15 +362,35 @@ class EnumConverter(ComplexConverterABC):
     match on either the name or the value of a filed is returned.
     """
 
+    def __init__(self) -> None:
+        self._lookup: Dict[enum.EnumMeta, Dict[Any, enum.Enum]] = {}
+
+    def _get_lookup(self, target: enum.EnumMeta) -> Dict[Any, enum.Enum]:
+        try:
+            return self._lookup[target]
+        except KeyError:
+            # values first so that on collision a name match wins,
+            # mirroring the name-before-value preference below.
+            lookup = dict(target._value2member_map_)
+            lookup.update(target.__members__)
+            self._lookup[target] = lookup
+            return lookup
+
     def can_convert(self, target: type) -> bool:
         return inspect.isclass(target) and issubclass(target, enum.Enum)
 
     def convert(self, value: Any, target: enum.EnumMeta) -> enum.Enum:
+        if isinstance(value, target):
+            return value
+
+        # merged name/value map turns the perfect-match cascade into a
+        # single dict probe.
         try:
-            return target[value]
-        except KeyError:
+            return self._get_lookup(target)[value]
+        except (KeyError, TypeError):
             pass
 
+        # enums can resolve values the map doesn't cover (_missing_ hooks)
         try:
             return target(value)
         except (ValueError, TypeError):
@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Callable, Optional, TYPE_CHECKING, Type, TypeVar
 
 from . import typeinspect
@@ -54,6 +55,8 @@ class UnboundField:
     Raises:
         ValueError: If both factory and default value are specified.
     """
+    __slots__ = ("key", "comment", "default_value", "default_factory", "converter")
+
     key: Optional[str]
     comment: Optional[str]
 
@@ -115,11 +118,16 @@ class Field(UnboundField):
         key (str): Name of the config key.
         value_type (Type): Expected type of the field.
     """
+    __slots__ = ("attribute", "value_type", "_is_sub_template", "_optional_type")
+
     attribute: str
     key: str
 
     value_type: Type
 
+    _is_sub_template: Optional[bool]
+    _optional_type: Optional[bool]
+
     def __init__(self, *,
                  attribute: str,
                  key: str = None,
@@ -129,8 +137,13 @@ class Field(UnboundField):
                  default_factory: ValueFactory = None,
                  converter: ConverterType = None,
                  ) -> None:
+        # interned so the getattr/setattr and mapping lookups on these
+        # names hit the identity fast path.
+        attribute = sys.intern(attribute)
         if key is None:
             key = attribute
+        else:
+            key = sys.intern(key)
 
         super().__init__(key=key, comment=comment,
                          default_value=default_value, default_factory=default_factory,
@@ -138,6 +151,9 @@ class Field(UnboundField):
         self.attribute = attribute
         self.value_type = value_type
 
+        self._is_sub_template = None
+        self._optional_type = None
+
     def __repr__(self) -> str:
         return f"Field(attribute={self.attribute!r}, value_type={self.value_type!r}, key={self.key!r}, comment={self.comment!r})"
 
@@ -148,7 +164,25 @@ class Field(UnboundField):
     @property
     def optional_type(self) -> bool:
         """Whether the value type is optional (ex: Optional[str])."""
-        return typeinspect.is_optional(self.value_type)
+        opt = self._optional_type
+        if opt is None:
+            opt = self._optional_type = typeinspect.is_optional(self.value_type)
+
+        return opt
+
+    @property
+    def is_sub_template(self) -> bool:
+        """Whether the value type is itself template-like.
+
+        The result is computed once (usually already at decoration time)
+        and cached, since the value type never changes.
+        """
+        sub = self._is_sub_template
+        if sub is None:
+            from .templ import is_template_like
+            sub = self._is_sub_template = is_template_like(self.value_type)
+
+        return sub
 
     @property
     def required(self) -> bool:
@@ -1,7 +1,9 @@
 import abc
 import dataclasses
 import functools
-from typing import Any, Dict, Iterable, Iterator, List, Mapping
+import sys
+import weakref
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
 
 import konfi
 
@@ -99,24 +101,53 @@ class QualifiedField:
     field: konfi.Field
 
 
+# flattened (parent fields, key path, field) entries per template class,
+# the template's shape is fixed so the recursive walk only has to happen
+# once instead of on every load.
+_FIELD_PLAN_CACHE: "weakref.WeakKeyDictionary[type, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _get_field_plan(template: type) -> Tuple[Tuple[Tuple["konfi.Field", ...], Tuple[str, ...], "konfi.Field"], ...]:
+    try:
+        return _FIELD_PLAN_CACHE[template]
+    except (KeyError, TypeError):
+        pass
+
+    plan: List[Tuple[Tuple[konfi.Field, ...], Tuple[str, ...], konfi.Field]] = []
+
+    def walk(parent_fields: Tuple[konfi.Field, ...], path: Tuple[str, ...],
+             fields: Iterable[konfi.Field]) -> None:
+        for field in fields:
+            key_path = path + (field.key,)
+
+            if field.is_sub_template:
+                walk(parent_fields + (field,), key_path, konfi.fields(field.value_type))
+            else:
+                plan.append((parent_fields, key_path, field))
+
+    walk((), (), konfi.fields(template))
+
+    plan_tuple = tuple(plan)
+    try:
+        _FIELD_PLAN_CACHE[template] = plan_tuple
+    except TypeError:
+        pass
+
+    return plan_tuple
+
+
 def iter_fields_recursively(obj: Any, template: Any) -> Iterator[QualifiedField]:
     """Iterate over all fields of the template recursively.
 
      Yields:
           `QualifiedField` instances.
      """
+    for parent_fields, key_path, field in _get_field_plan(template):
+        parent = obj
+        for parent_field in parent_fields:
+            parent = _get_sub_obj(parent, parent_field)
 
-    def iter_fields(parent: Any, path: List[str], fields: Iterable[konfi.Field]) -> None:
-        for field in fields:
-            key_path = [*path, field.key]
-
-            if konfi.is_template_like(field.value_type):
-                sub_obj = _get_sub_obj(obj, field)
-                yield from iter_fields(sub_obj, key_path, konfi.fields(field.value_type))
-            else:
-                yield QualifiedField(parent, key_path, field)
-
-    yield from iter_fields(obj, [], konfi.fields(template))
+        yield QualifiedField(parent, list(key_path), field)
 
 
 def load_field_value(obj: Any, field: konfi.Field, value: Any) -> None:
@@ -146,6 +177,26 @@ def _get_sub_obj(obj: Any, field: konfi.Field) -> Any:
     return value
 
 
+# key -> field mapping per fields tuple, keyed on the tuple's id. Since
+# templates hand out the same cached tuple for every load this builds the
+# mapping once per template instead of once per record. The tuple is kept
+# in the entry to guard against id reuse.
+_FIELDS_BY_KEY_CACHE: Dict[int, Any] = {}
+
+
+def _fields_by_key(fields: Iterable[konfi.Field]) -> Dict[str, konfi.Field]:
+    if isinstance(fields, tuple):
+        entry = _FIELDS_BY_KEY_CACHE.get(id(fields))
+        if entry is not None and entry[0] is fields:
+            return entry[1]
+
+        by_key = {field.key: field for field in fields}
+        _FIELDS_BY_KEY_CACHE[id(fields)] = (fields, by_key)
+        return by_key
+
+    return {field.key: field for field in fields}
+
+
 def load_fields_values(obj: Any, fields: Iterable[konfi.Field], mapping: Mapping, *,
                        ignore_unknown: bool = False) -> None:
     """Load the values for the fields from the mapping.
@@ -162,11 +213,16 @@ def load_fields_values(obj: Any, fields: Iterable[konfi.Field], mapping: Mapping
         PathError: If there is an issue with a field.
             If multiple fields have an error, `MultiPathError` is raised.
     """
-    _field_by_keys: Dict[str, konfi.Field] = {field.key: field for field in fields}
+    _field_by_keys: Dict[str, konfi.Field] = _fields_by_key(fields)
 
     field_errors: List[PathError] = []
 
     for key, value in mapping.items():
+        # field keys are interned, interning the incoming key as well lets
+        # the lookup (and later error paths) compare by identity.
+        if type(key) is str:
+            key = sys.intern(key)
+
         try:
             field = _field_by_keys[key]
         except KeyError:
@@ -175,7 +231,7 @@ def load_fields_values(obj: Any, fields: Iterable[konfi.Field], mapping: Mapping
             else:
                 raise PathError([key], f"unexpected config key: {key!r}")
 
-        if konfi.is_template_like(field.value_type) and isinstance(value, Mapping):
+        if field.is_sub_template and isinstance(value, Mapping):
             sub_obj = _get_sub_obj(obj, field)
             loader = functools.partial(load_fields_values, sub_obj, konfi.fields(sub_obj), value)
         else:
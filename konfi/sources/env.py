@@ -1,7 +1,7 @@
 import ast
 import os
 import re
-from typing import Any, Callable, Dict, Iterable, List, Pattern, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Pattern, Tuple, Type, Union
 
 import konfi
 from konfi import source
@@ -12,6 +12,11 @@ __all__ = ["Env",
 
 unportable_chars_pattern: Pattern = re.compile(r"^\s*\d+|[^a-z0-9]+", re.IGNORECASE)
 
+# all bytes apart from ASCII letters and digits, used to delete unportable
+# characters with the C-level bytes.translate instead of the regex.
+_UNPORTABLE_BYTES = bytes(c for c in range(256)
+                          if not (48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122))
+
 Decoder = Callable[[str], Any]
 Decoder.__doc__ = \
     """Callable which decodes the value of an environment variable."""
@@ -72,9 +77,25 @@ NameBuilder.__doc__ = \
     environment variable."""
 
 
+def _clean_name_part(part: str) -> str:
+    try:
+        raw = part.encode("ascii")
+    except UnicodeError:
+        # non-ASCII segments take the slower regex path
+        return unportable_chars_pattern.sub("", part).upper()
+
+    # like the regex, digits are only stripped at the very start of the
+    # segment ("_1foo" keeps its 1, "1foo" loses it)
+    stripped = raw.lstrip(b" \t\n\r\x0b\f")
+    if stripped[:1].isdigit():
+        raw = stripped.lstrip(b"0123456789")
+
+    return raw.translate(None, _UNPORTABLE_BYTES).upper().decode("ascii")
+
+
 def build_env_name(path: Iterable[str]) -> str:
     """Create the name of an environment variable for the given path."""
-    return "_".join(unportable_chars_pattern.sub("", part) for part in path).upper()
+    return "_".join(_clean_name_part(part) for part in path)
 
 
 class Env(konfi.SourceABC):
@@ -126,6 +147,9 @@ class Env(konfi.SourceABC):
     _prefix: str
     _decoder: Decoder
     _name_builder: NameBuilder
+    _name_of: NameBuilder
+
+    _decoded: Dict[str, Tuple[str, Any]]
 
     def __init__(self, prefix: str = "", *,
                  decoder: ResolvableDecoder = "python",
@@ -135,27 +159,57 @@ class Env(konfi.SourceABC):
         self._decoder = resolve_decoder(decoder)
         self._name_builder = name_builder
 
+        # without a prefix the name builder can be used directly, which
+        # saves the concatenation for every field.
+        if prefix:
+            self._name_of = lambda path: prefix + name_builder(path)
+        else:
+            self._name_of = name_builder
+
+        # raw and decoded value of each variable from the previous load,
+        # so repeated loads of an unchanged environment skip the decoder.
+        self._decoded = {}
+
     def __str__(self) -> str:
         return f"Environment ({self._prefix!r})"
 
     def get_env_name(self, path: List[str]) -> str:
         """Combine prefix and name builder result."""
-        return f"{self._prefix}{self._name_builder(path)}"
+        return self._name_of(path)
 
-    def _load_path(self, path: List[str], parent: Any, field: konfi.Field) -> None:
-        key = self.get_env_name(path)
-        try:
-            raw_value = os.environ[key]
-        except KeyError:
-            return
-
-        try:
-            value = self._decoder(raw_value)
-        except Exception as e:
-            raise konfi.PathError(path, f"can't decode {raw_value!r}") from e
+    def load_into(self, obj: Any, template: Type) -> None:
+        # bind everything that's invariant to locals, this loop runs once
+        # per field of the (recursively flattened) template.
+        prefix = self._prefix
+        if prefix:
+            # snapshot the matching variables in one pass, per-field
+            # lookups then hit a small plain dict instead of os.environ's
+            # key-encoding wrapper.
+            env_get = {k: v for k, v in os.environ.items() if k.startswith(prefix)}.get
+        else:
+            env_get = os.environ.get
 
-        source.load_field_value(parent, field, value)
+        decode = self._decoder
+        # bound through the public method so subclasses can override it
+        name_of = self.get_env_name
+        load_value = source.load_field_value
+        decoded = self._decoded
 
-    def load_into(self, obj: Any, template: Type) -> None:
         for qfield in source.iter_fields_recursively(obj, template):
-            self._load_path(qfield.path, qfield.parent, qfield.field)
+            key = name_of(qfield.path)
+            raw_value = env_get(key)
+            if raw_value is None:
+                continue
+
+            prev = decoded.get(key)
+            if prev is not None and (prev[0] is raw_value or prev[0] == raw_value):
+                value = prev[1]
+            else:
+                try:
+                    value = decode(raw_value)
+                except Exception as e:
+                    raise konfi.PathError(qfield.path, f"can't decode {raw_value!r}") from e
+
+                decoded[key] = (raw_value, value)
+
+            load_value(qfield.parent, qfield.field, value)
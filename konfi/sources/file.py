@@ -1,4 +1,6 @@
 import pathlib
+import sys
+import types
 from typing import Any, Callable, Dict, Optional
 
 import konfi
@@ -18,6 +20,10 @@ FileLoaderType.__doc__ = \
 
 _FILE_LOADERS: Dict[str, FileLoaderType] = {}
 
+# read-only view used for lookups, guarantees that readers never see the
+# underlying dict mid-mutation and avoids accidental writes.
+_FILE_LOADERS_VIEW: types.MappingProxyType = types.MappingProxyType(_FILE_LOADERS)
+
 
 def register_file_loader(*file_types: str, replace: bool = False):
     """Decorator to register a file loader.
@@ -41,7 +47,8 @@ def register_file_loader(*file_types: str, replace: bool = False):
             raise TypeError("decorated value must be a file loader constructor")
 
         for file_type in file_types:
-            file_type = file_type.lower()
+            # interned extensions let dict lookups hit the identity fast path
+            file_type = sys.intern(file_type.lower())
             if file_type in _FILE_LOADERS and not replace:
                 raise ValueError(f"file loader for file type {file_type!r} already exists.")
 
@@ -58,7 +65,7 @@ def has_file_loader(ext: str) -> bool:
     Args:
         ext: File extension including the leading dot.
     """
-    return ext in _FILE_LOADERS
+    return ext in _FILE_LOADERS_VIEW
 
 
 class FileLoader(konfi.SourceABC):
@@ -100,10 +107,9 @@ class FileLoader(konfi.SourceABC):
                  ignore_no_loader: bool = False,
                  ignore_not_found: bool = False,
                  **kwargs: Any) -> None:
-        suffix = pathlib.Path(path).suffix.lower()
-        try:
-            loader_cls = _FILE_LOADERS[suffix]
-        except KeyError:
+        suffix = sys.intern(pathlib.Path(path).suffix.lower())
+        loader_cls = _FILE_LOADERS_VIEW.get(suffix)
+        if loader_cls is None:
             if ignore_no_loader:
                 loader = None
             else:
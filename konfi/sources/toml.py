@@ -1,4 +1,5 @@
-from typing import Any
+import os
+from typing import Any, Optional, Tuple
 
 import konfi
 from konfi.source import load_fields_values
@@ -6,31 +7,53 @@ from .file import register_file_loader
 
 __all__ = ["TOML"]
 
+_toml_mod = None
+
+
+def _get_toml():
+    """Import the toml module once and reuse it for subsequent loads."""
+    global _toml_mod
+    if _toml_mod is None:
+        try:
+            import toml
+        except ImportError as e:
+            raise ImportError("Couldn't import the 'toml' package. Make sure it's installed.") from e
+
+        _toml_mod = toml
+
+    return _toml_mod
+
 
 @register_file_loader(".toml")
 class TOML(konfi.SourceABC):
     _path: str
     _ignore_not_found: bool
+    _parsed: Optional[Tuple[Tuple[int, int], Any]]
 
     def __init__(self, path: str, *, ignore_not_found: bool = False, **_) -> None:
         self._path = path
         self._ignore_not_found = ignore_not_found
+        self._parsed = None
 
     def __str__(self) -> str:
         return f"TOML: {self._path!r}"
 
     def load_into(self, obj: Any, template: type) -> None:
+        # a single stat handles both the not-found decision and the
+        # parse cache key for repeated loads of an unchanged file.
         try:
-            import toml
-        except ImportError as e:
-            raise ImportError("Couldn't import the 'toml' package. Make sure it's installed.") from e
-
-        try:
-            data = toml.load(self._path)
-        except FileNotFoundError as e:
+            st = os.stat(self._path)
+        except FileNotFoundError:
             if self._ignore_not_found:
                 return
             else:
-                raise e
+                raise
+
+        cache_key = (st.st_mtime_ns, st.st_size)
+        if self._parsed is not None and self._parsed[0] == cache_key:
+            data = self._parsed[1]
+        else:
+            data = _get_toml().load(self._path)
+            self._parsed = (cache_key, data)
 
         load_fields_values(obj, konfi.fields(template), data)
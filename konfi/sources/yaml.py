@@ -1,4 +1,6 @@
-from typing import Any, Type
+import json
+import os
+from typing import Any, Optional, Tuple, Type
 
 import konfi
 from konfi.source import load_fields_values
@@ -6,6 +8,22 @@ from .file import register_file_loader
 
 __all__ = ["YAML"]
 
+_yaml_mod = None
+
+
+def _get_yaml():
+    """Import the yaml module once and reuse it for subsequent loads."""
+    global _yaml_mod
+    if _yaml_mod is None:
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError("Couldn't import 'pyyaml' package. Make sure it's installed.") from e
+
+        _yaml_mod = yaml
+
+    return _yaml_mod
+
 
 @register_file_loader(".yml", ".yaml", ".json")
 class YAML(konfi.SourceABC):
@@ -20,27 +38,45 @@ class YAML(konfi.SourceABC):
     """
     _path: str
     _ignore_not_found: bool
+    _is_json: bool
+    _parsed: Optional[Tuple[Tuple[int, int], Any]]
 
     def __init__(self, path: str, *, ignore_not_found: bool = False, **_) -> None:
         self._path = path
         self._ignore_not_found = ignore_not_found
+        self._is_json = path.lower().endswith(".json")
+        self._parsed = None
 
     def __str__(self) -> str:
         return f"YAML: {self._path!r}"
 
     def load_into(self, obj: Any, template: Type) -> None:
+        # a single stat handles both the not-found decision and the
+        # parse cache key for repeated loads of an unchanged file.
         try:
-            import yaml
-        except ImportError as e:
-            raise ImportError("Couldn't import 'pyyaml' package. Make sure it's installed.") from e
-
-        try:
-            with open(self._path, "r") as f:
-                data = yaml.safe_load(f)
-        except FileNotFoundError as e:
+            st = os.stat(self._path)
+        except FileNotFoundError:
             if self._ignore_not_found:
                 return
             else:
-                raise e
+                raise
+
+        cache_key = (st.st_mtime_ns, st.st_size)
+        if self._parsed is not None and self._parsed[0] == cache_key:
+            data = self._parsed[1]
+        else:
+            with open(self._path, "r") as f:
+                if self._is_json:
+                    # the C-accelerated json parser is much faster than
+                    # yaml.safe_load and JSON is a subset of YAML anyway.
+                    try:
+                        data = json.load(f)
+                    except json.JSONDecodeError:
+                        f.seek(0)
+                        data = _get_yaml().safe_load(f)
+                else:
+                    data = _get_yaml().safe_load(f)
+
+            self._parsed = (cache_key, data)
 
         load_fields_values(obj, konfi.fields(template), data)
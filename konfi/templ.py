@@ -1,7 +1,7 @@
 import dataclasses
-import functools
 import inspect
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, get_type_hints, overload
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from . import typeinspect
 from .converter import has_converter
@@ -14,6 +14,9 @@ __all__ = ["template", "is_template", "is_template_like",
            "ensure_complete"]
 
 _FIELDS_ATTR = "__template_fields__"
+_FIELDS_TUPLE_ATTR = "__template_fields_tuple__"
+_ENSURE_ATTR = "__template_ensure__"
+_IS_TEMPLATE_ATTR = "__is_template__"
 
 
 def _make_fields(cls: type, *, template_bases_only: bool = True) -> Dict[str, Field]:
@@ -21,13 +24,9 @@ def _make_fields(cls: type, *, template_bases_only: bool = True) -> Dict[str, Fi
 
     if template_bases_only:
         for base in cls.__mro__[:0:-1]:
-            try:
-                _fields = getattr(base, _FIELDS_ATTR)
-            except AttributeError:
-                continue
-
-            for attr, _field in _fields.items():
-                cls_fields[attr] = _field
+            _fields = base.__dict__.get(_FIELDS_ATTR)
+            if _fields is not None:
+                cls_fields.update(_fields)
 
         cls_annotations = typeinspect.get_class_type_hints_strict(cls)
     else:
@@ -40,6 +39,12 @@ def _make_fields(cls: type, *, template_bases_only: bool = True) -> Dict[str, Fi
             cls_fields[attr] = Field(attribute=attr, value_type=typ)
             continue
 
+        # on slotted classes the attribute resolves to its own slot
+        # descriptor, which is no more a default value than AttributeError.
+        if inspect.ismemberdescriptor(value):
+            cls_fields[attr] = Field(attribute=attr, value_type=typ)
+            continue
+
         if isinstance(value, UnboundField):
             field = upgrade_unbound(value, attribute=attr, value_type=typ)
 
@@ -52,8 +57,11 @@ def _make_fields(cls: type, *, template_bases_only: bool = True) -> Dict[str, Fi
         else:
             field = Field(attribute=attr, value_type=typ, default_value=value)
 
+        # hoisted to decoration time so load paths get a plain flag
+        field._is_sub_template = is_template_like(typ)
+
         if not (field.converter is not None
-                or is_template_like(typ)
+                or field._is_sub_template
                 or has_converter(typ)):
             raise TypeError(f"Field {attr!r} doesn't have a converter.")
 
@@ -65,6 +73,9 @@ def _make_fields(cls: type, *, template_bases_only: bool = True) -> Dict[str, Fi
 def _make_template(cls: type, *, template_bases_only: bool = True):
     _fields = _make_fields(cls, template_bases_only=template_bases_only)
     setattr(cls, _FIELDS_ATTR, _fields)
+    # materialised once so fields() doesn't rebuild the tuple on every call
+    setattr(cls, _FIELDS_TUPLE_ATTR, tuple(_fields.values()))
+    setattr(cls, _IS_TEMPLATE_ATTR, True)
 
 
 def template(*, template_bases_only: bool = True):
@@ -77,6 +88,12 @@ def template(*, template_bases_only: bool = True):
     (see `konfi.field`) which is used directly and the class variable is
     replaced.
 
+    The decorated class may define `__slots__` to avoid the per-instance
+    `__dict__`; instances are created without calling the constructor, so
+    this works out of the box. Note that slotted attributes can't carry
+    class-level default values, Python forbids the conflicting class
+    variable.
+
     Args:
         template_bases_only: If set to `True` (default) only fields from
             bases which are themselves templates are added to the template.
@@ -100,7 +117,8 @@ def template(*, template_bases_only: bool = True):
 
 def is_template(obj: Any) -> bool:
     """Check whether the given object is a template instance or class."""
-    return hasattr(obj, _FIELDS_ATTR)
+    cls = obj if isinstance(obj, type) else type(obj)
+    return getattr(cls, _IS_TEMPLATE_ATTR, False)
 
 
 def is_template_like(obj: Any) -> bool:
@@ -108,10 +126,12 @@ def is_template_like(obj: Any) -> bool:
 
     Currently this includes templates and dataclasses.
     """
-    return is_template(obj) or dataclasses.is_dataclass(obj)
+    cls = obj if isinstance(obj, type) else type(obj)
+    return getattr(cls, _IS_TEMPLATE_ATTR, False) \
+           or getattr(cls, "__dataclass_fields__", None) is not None
 
 
-def _field_from_dataclass_field(f: dataclasses.Field) -> Field:
+def _field_from_dataclass_field(f: dataclasses.Field, typ: type) -> Field:
     default_value = f.default
     if default_value is dataclasses.MISSING:
         default_value = MISSING
@@ -120,25 +140,82 @@ def _field_from_dataclass_field(f: dataclasses.Field) -> Field:
     if default_factory is dataclasses.MISSING:
         default_factory = None
 
-    return Field(attribute=f.name, key=f.name,
-                 value_type=f.type,
-                 default_value=default_value, default_factory=default_factory)
+    field = Field(attribute=f.name, key=f.name,
+                  value_type=typ,
+                  default_value=default_value, default_factory=default_factory)
+    field._is_sub_template = is_template_like(typ)
+    return field
+
+
+# sentinel marking regular fields, pseudo-fields (InitVar/ClassVar) carry
+# a different marker and have to be skipped like dataclasses.fields does.
+_DATACLASS_FIELD = getattr(dataclasses, "_FIELD", None)
+
+# weak keys so the caches neither pin dataclasses alive nor evict
+# entries the way a bounded lru_cache would.
+_DATACLASS_FIELDS_CACHE: "weakref.WeakKeyDictionary[type, Dict[str, Field]]" = weakref.WeakKeyDictionary()
+_DATACLASS_FIELDS_TUPLE_CACHE: "weakref.WeakKeyDictionary[type, Tuple[Field, ...]]" = weakref.WeakKeyDictionary()
 
 
-@functools.lru_cache(64)
 def _fields_from_dataclass(obj: Any) -> Dict[str, Field]:
-    data_fields: Tuple[dataclasses.Field, ...] = dataclasses.fields(obj)
-    return {f.name: _field_from_dataclass_field(f) for f in data_fields}
+    cls = obj if isinstance(obj, type) else type(obj)
+    try:
+        return _DATACLASS_FIELDS_CACHE[cls]
+    except KeyError:
+        pass
+
+    if _DATACLASS_FIELD is not None:
+        data_fields: Iterable[dataclasses.Field] = (f for f in cls.__dataclass_fields__.values()
+                                                    if f._field_type is _DATACLASS_FIELD)
+    else:
+        data_fields = dataclasses.fields(cls)
+    data_fields = list(data_fields)
+
+    # string annotations (e.g. from __future__ import annotations) have to
+    # be resolved, but only once per class thanks to the cache below.
+    if any(isinstance(f.type, str) for f in data_fields):
+        try:
+            hints = get_type_hints(cls)
+        except Exception:
+            hints = {}
+    else:
+        hints = {}
 
+    cls_fields = {f.name: _field_from_dataclass_field(f, hints.get(f.name, f.type)) for f in data_fields}
+    _DATACLASS_FIELDS_CACHE[cls] = cls_fields
+    return cls_fields
 
-def _get_fields(obj: Any) -> Dict[str, Field]:
+
+def _fields_tuple_from_dataclass(obj: Any) -> Tuple[Field, ...]:
+    cls = obj if isinstance(obj, type) else type(obj)
     try:
-        return getattr(obj, _FIELDS_ATTR)
-    except AttributeError:
-        if dataclasses.is_dataclass(obj):
-            return _fields_from_dataclass(obj)
+        return _DATACLASS_FIELDS_TUPLE_CACHE[cls]
+    except KeyError:
+        pass
+
+    fields_tuple = tuple(_fields_from_dataclass(cls).values())
+    _DATACLASS_FIELDS_TUPLE_CACHE[cls] = fields_tuple
+    return fields_tuple
+
+
+def _get_fields(obj: Any) -> Dict[str, Field]:
+    cls = obj if isinstance(obj, type) else type(obj)
 
-        raise TypeError("must be called with a template")
+    # decorated templates keep their fields in the class' own dict,
+    # a single lookup without the descriptor protocol covers them.
+    cls_fields = cls.__dict__.get(_FIELDS_ATTR)
+    if cls_fields is not None:
+        return cls_fields
+
+    # undecorated subclasses of templates inherit their fields
+    cls_fields = getattr(cls, _FIELDS_ATTR, None)
+    if cls_fields is not None:
+        return cls_fields
+
+    if dataclasses.is_dataclass(cls):
+        return _fields_from_dataclass(cls)
+
+    raise TypeError("must be called with a template")
 
 
 def fields(obj: Any) -> Tuple[Field, ...]:
@@ -150,7 +227,14 @@ def fields(obj: Any) -> Tuple[Field, ...]:
     Returns:
         A tuple containing all fields of the template.
     """
-    return tuple(_get_fields(obj).values())
+    tup = getattr(obj, _FIELDS_TUPLE_ATTR, None)
+    if tup is not None:
+        return tup
+
+    if dataclasses.is_dataclass(obj):
+        return _fields_tuple_from_dataclass(obj)
+
+    raise TypeError("must be called with a template")
 
 
 def get_field(obj: Any, attr: str) -> Optional[Field]:
@@ -167,25 +251,85 @@ def get_field(obj: Any, attr: str) -> Optional[Field]:
 
 T = TypeVar("T")
 
-
-@overload
-def create_object_from_template(templ: type) -> Any: ...
-
-
-@overload
-def create_object_from_template(templ: Type[T]) -> T: ...
+# bound once, this runs for every (sub-)template instance that is created
+_new_object = object.__new__
 
 
 def create_object_from_template(templ: Type[T]) -> T:
     """Create an empty object for the given template.
 
+    This bypasses the template's constructor (`__init__` and a custom
+    `__new__` alike), the attributes are assigned afterwards by the
+    sources. Works for `__slots__`-based templates as well.
+
     Args:
         templ: Template-like object to create an instance for.
 
     Returns:
         New object which is an instance of the template.
     """
-    return object.__new__(templ)
+    return _new_object(templ)
+
+
+def _collect_incomplete(obj: Any, templ: type, path: Tuple[str, ...], errors: List[PathError]) -> None:
+    """Run the template's compiled collector, compiling it on first use."""
+    collect = templ.__dict__.get(_ENSURE_ATTR) if isinstance(templ, type) else None
+    if collect is None:
+        collect = _compile_ensure(templ)
+        try:
+            setattr(templ, _ENSURE_ATTR, collect)
+        except (AttributeError, TypeError):
+            pass
+
+    collect(obj, path, errors)
+
+
+def _compile_ensure(templ: type) -> Any:
+    """Build a specialised field collector function for the template.
+
+    The generated function is straight-line code with one block per field,
+    all field metadata (defaults, keys, sub-templates) is bound in the
+    function's namespace instead of being looked up per call. Instead of
+    raising, it appends errors carrying the full path to a shared list,
+    which avoids the exception construction and path backtracing per
+    recursion level.
+    """
+    ns: Dict[str, Any] = {
+        "_FieldError": FieldError,
+        "_NoDefaultValue": NoDefaultValue,
+        "_collect_incomplete": _collect_incomplete,
+    }
+
+    lines: List[str] = [
+        "def _collect(obj, path, errors):",
+    ]
+
+    for i, f in enumerate(fields(templ)):
+        ns[f"_field{i}"] = f
+        ns[f"_key{i}"] = f.key
+        ns[f"_default{i}"] = f.get_default
+
+        lines.extend((
+            f"    try:",
+            f"        val{i} = obj.{f.attribute}",
+            f"    except AttributeError:",
+            f"        try:",
+            f"            obj.{f.attribute} = _default{i}()",
+            f"        except _NoDefaultValue:",
+            f"            errors.append(_FieldError(path + (_key{i},), _field{i}, \"required value missing\"))",
+        ))
+
+        if f.is_sub_template:
+            ns[f"_type{i}"] = f.value_type
+            lines.extend((
+                f"    else:",
+                f"        _collect_incomplete(val{i}, _type{i}, path + (_key{i},), errors)",
+            ))
+
+    lines.append("    return None")
+
+    exec("\n".join(lines), ns)
+    return ns["_collect"]
 
 
 def ensure_complete(obj: Any, templ: type) -> None:
@@ -202,30 +346,12 @@ def ensure_complete(obj: Any, templ: type) -> None:
             If there are multiple errors, a `MultiPathError` exception
             is raised.
     """
-    path_errors: List[PathError] = []
+    errors: List[PathError] = []
+    _collect_incomplete(obj, templ, (), errors)
 
-    for f in fields(templ):
-        try:
-            val = getattr(obj, f.attribute)
-        except AttributeError:
-            try:
-                default_val = f.get_default()
-            except NoDefaultValue:
-                e = FieldError([f.key], f, "required value missing")
-                path_errors.append(e)
-            else:
-                setattr(obj, f.attribute, default_val)
-
-            continue
+    if not errors:
+        return
+    if len(errors) == 1:
+        raise errors[0]
 
-        if is_template_like(f.value_type):
-            try:
-                ensure_complete(val, f.value_type)
-            except PathError as e:
-                e.backtrace_path(f.key)
-                path_errors.append(e)
-
-    if len(path_errors) == 1:
-        raise path_errors[0]
-    elif path_errors:
-        raise MultiPathError([], path_errors, f"{templ.__qualname__!r} is incomplete")
+    raise MultiPathError([], errors, f"{templ.__qualname__!r} is incomplete")
@@ -1,9 +1,19 @@
-"""Runtime introspection for typings."""
+"""Runtime introspection for typings.
 
+These helpers sit on the hot path of every load, so the expensive
+introspection (origin and argument extraction, handler construction) is
+cached per type. The module deliberately stays pure Python — konfi
+installs without a build step and the caches already reduce the steady
+state to dict probes, so a compiled extension would buy little.
+"""
+
+import functools
 import inspect
 import sys
+import typing
+import weakref
 from typing import Any, Generic, Iterable, Mapping, Optional, Tuple, TypeVar, \
-    Union, _GenericAlias, _eval_type, Dict, ForwardRef
+    Union, _eval_type, Dict, ForwardRef
 
 TypeTuple = Tuple[type, ...]
 TypeTuple.__doc__ = \
@@ -16,11 +26,16 @@ def class_and_subclass(typ: type, cls: type) -> bool:
     return inspect.isclass(typ) and issubclass(typ, cls)
 
 
+@functools.lru_cache(maxsize=None)
 def get_origin(typ: type) -> Optional[type]:
-    if isinstance(typ, _GenericAlias):
-        return typ.__origin__
+    return typing.get_origin(typ)
+
 
-    return None
+@functools.lru_cache(maxsize=None)
+def _origin_subclass(typ_origin: type, origin: type) -> bool:
+    # issubclass against the collection ABCs walks the registry via
+    # __subclasshook__, caching turns the repeat checks into dict probes.
+    return class_and_subclass(typ_origin, origin)
 
 
 def has_origin(typ: type, origin: type) -> bool:
@@ -28,19 +43,34 @@ def has_origin(typ: type, origin: type) -> bool:
     if typ_origin is None:
         return False
 
-    return class_and_subclass(typ_origin, origin)
+    return _origin_subclass(typ_origin, origin)
+
+
+# keyed on identity, not equality: differently ordered unions compare
+# equal (Union[int, str] == Union[str, int]) but their args must not be
+# conflated, member order decides conversion preference.
+_TYPE_ARGS_CACHE: Dict[int, Tuple[type, TypeTuple]] = {}
 
 
 def get_type_args(typ: type) -> TypeTuple:
-    if isinstance(typ, _GenericAlias):
-        return typ.__args__
+    entry = _TYPE_ARGS_CACHE.get(id(typ))
+    if entry is None or entry[0] is not typ:
+        entry = (typ, typing.get_args(typ))
+        _TYPE_ARGS_CACHE[id(typ)] = entry
 
-    return ()
+    return entry[1]
 
 
 def get_parameters(typ: type) -> TypeTuple:
-    if isinstance(typ, _GenericAlias):
-        return typ.__parameters__
+    params = getattr(typ, "__parameters__", None)
+    if params is not None:
+        return params
+
+    # bare special aliases (List, Dict, ...) no longer expose their
+    # parameters, only how many they expect.
+    nparams = getattr(typ, "_nparams", None)
+    if nparams:
+        return tuple(TypeVar(f"T{i}") for i in range(nparams))
 
     return ()
 
@@ -54,10 +84,12 @@ def is_any(typ: type) -> bool:
     return typ is Any
 
 
+@functools.lru_cache(maxsize=None)
 def is_union(typ: type) -> bool:
     return get_origin(typ) is Union
 
 
+@functools.lru_cache(maxsize=None)
 def is_tuple(typ: type) -> bool:
     return typ is Tuple \
            or get_origin(typ) is tuple \
@@ -70,17 +102,20 @@ def is_typevar(typ: type) -> bool:
 
 def is_generic(typ: type) -> bool:
     return class_and_subclass(typ, Generic) \
-           or isinstance(typ, _GenericAlias)
+           or typing.get_origin(typ) is not None
 
 
+@functools.lru_cache(maxsize=None)
 def is_generic_iterable(typ: type) -> bool:
     return is_generic(typ) and has_origin(typ, Iterable)
 
 
+@functools.lru_cache(maxsize=None)
 def is_generic_mapping(typ: type) -> bool:
     return is_generic(typ) and has_origin(typ, Mapping)
 
 
+@functools.lru_cache(maxsize=None)
 def is_optional(typ: type) -> bool:
     if typ is NoneType:
         return True
@@ -91,13 +126,11 @@ def is_optional(typ: type) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=None)
 def resolve_tuple(typ: type) -> Tuple[TypeTuple, Optional[int]]:
     args = get_type_args(typ)
-    # homogeneous variadic tuple
-    if len(args) == 2 and args[1] == Ellipsis:
-        return (args[0],), None
-    else:
-        return args, len(args)
+    # homogeneous variadic tuples are (T, Ellipsis)
+    return (args[:-1], None) if args and args[-1] is Ellipsis else (args, len(args))
 
 
 def _has_union_type(obj: Any, union: type) -> bool:
@@ -110,12 +143,12 @@ def _has_tuple_type(obj: Any, tup: type) -> bool:
 
     types, n = resolve_tuple(tup)
     if n is None:
-        typ = types[0]
-        return all(has_type(val, typ) for val in obj)
+        # hoist the element handler so the loop runs in C via map
+        return all(map(_get_type_handler(types[0]), obj))
     elif n != len(obj):
         return False
     else:
-        return all(has_type(val, typ) for val, typ in zip(obj, types))
+        return all(handler(val) for handler, val in zip(map(_get_type_handler, types), obj))
 
 
 def _has_generic_iterable_type(obj: Any, iter_type: type) -> bool:
@@ -123,8 +156,7 @@ def _has_generic_iterable_type(obj: Any, iter_type: type) -> bool:
     if not has_type(obj, container_type):
         return False
 
-    item_type = get_type_args(iter_type)[0]
-    return all(has_type(item, item_type) for item in obj)
+    return all(map(_get_type_handler(get_type_args(iter_type)[0]), obj))
 
 
 def _has_generic_mapping_type(obj: Any, map_type: type) -> bool:
@@ -133,29 +165,63 @@ def _has_generic_mapping_type(obj: Any, map_type: type) -> bool:
         return False
 
     key_type, value_type = get_type_args(map_type)
-    return all(has_type(key, key_type) and has_type(value, value_type) for key, value in obj.items())
+    key_check = _get_type_handler(key_type)
+    value_check = _get_type_handler(value_type)
+    return all(map(key_check, obj.keys())) and all(map(value_check, obj.values()))
 
 
-def has_type(obj: Any, typ: type) -> bool:
+def _is_plain_class(typ: type) -> bool:
+    """Check whether the handler for the type would be a plain isinstance."""
+    return inspect.isclass(typ) \
+           and not (is_tuple(typ) or is_generic_iterable(typ) or is_generic_mapping(typ))
+
+
+def _make_type_handler(typ: type):
     if is_any(typ):
-        return True
+        return lambda obj: True
 
     if is_union(typ):
-        return _has_union_type(obj, typ)
+        args = get_type_args(typ)
+        # unions of plain classes collapse into a single isinstance call,
+        # CPython checks the whole tuple in C.
+        if all(map(_is_plain_class, args)):
+            return lambda obj: isinstance(obj, args)
+
+        handlers = tuple(_get_type_handler(t) for t in args)
+        return lambda obj: any(handler(obj) for handler in handlers)
 
     if is_tuple(typ):
-        return _has_tuple_type(obj, typ)
+        return lambda obj: _has_tuple_type(obj, typ)
 
     if is_generic_iterable(typ):
-        return _has_generic_iterable_type(obj, typ)
+        return lambda obj: _has_generic_iterable_type(obj, typ)
 
     if is_generic_mapping(typ):
-        return _has_generic_mapping_type(obj, typ)
+        return lambda obj: _has_generic_mapping_type(obj, typ)
 
     # TODO this doesn't feel safe
-    return isinstance(obj, typ)
+    return lambda obj: isinstance(obj, typ)
+
+
+# handler per type keyed on its id, the type itself is kept in the entry
+# both as a strong reference and to guard against id reuse.
+_TYPE_HANDLERS: Dict[int, Tuple[type, Any]] = {}
+
 
+def _get_type_handler(typ: type):
+    entry = _TYPE_HANDLERS.get(id(typ))
+    if entry is None or entry[0] is not typ:
+        entry = (typ, _make_type_handler(typ))
+        _TYPE_HANDLERS[id(typ)] = entry
 
+    return entry[1]
+
+
+def has_type(obj: Any, typ: type) -> bool:
+    return _get_type_handler(typ)(obj)
+
+
+@functools.lru_cache(maxsize=None)
 def friendly_name(typ: Any) -> str:
     if inspect.isclass(typ) and typ.__module__ == "builtins":
         return typ.__qualname__
@@ -168,6 +234,11 @@ def friendly_name(typ: Any) -> str:
         return repr(typ)
 
 
+# resolved annotations per class, evaluating forward references is by far
+# the most expensive part of building a template.
+_class_hints_cache: "weakref.WeakKeyDictionary[type, Dict[str, type]]" = weakref.WeakKeyDictionary()
+
+
 def get_class_type_hints_strict(cls: type,
                                 globalns: Mapping[str, Any] = None,
                                 localns: Mapping[str, Any] = None
@@ -175,6 +246,15 @@ def get_class_type_hints_strict(cls: type,
     if not inspect.isclass(cls):
         raise TypeError("cls needs to be a class. Use typing.get_type_hints for other types")
 
+    # only cache the default namespace resolution, custom namespaces could
+    # evaluate the same annotation to something else.
+    use_cache = globalns is None and localns is None
+    if use_cache:
+        try:
+            return _class_hints_cache[cls]
+        except KeyError:
+            pass
+
     if globalns is None:
         globalns = sys.modules[cls.__module__].__dict__
 
@@ -191,4 +271,7 @@ def get_class_type_hints_strict(cls: type,
         value = _eval_type(value, globalns, localns)
         hints[name] = value
 
+    if use_cache:
+        _class_hints_cache[cls] = hints
+
     return hints
@@ -27,6 +27,22 @@ def test_unregister_converter():
     assert not konfi.has_converter(SentinelC)
 
 
+def test_has_converter_cache_invalidation():
+    class Sentinel: ...
+
+    # prime the cache with a miss before mutating the registry
+    assert not konfi.has_converter(Sentinel)
+
+    @konfi.register_converter(Sentinel)
+    def func_conv(value):
+        return Sentinel()
+
+    assert konfi.has_converter(Sentinel)
+
+    konfi.unregister_converter(func_conv)
+    assert not konfi.has_converter(Sentinel)
+
+
 def test_unregister_complex_converter():
     class SentinelA: ...
 
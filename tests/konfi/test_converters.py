@@ -12,6 +12,14 @@ def test_union_converter():
     assert konfi.convert_value("5", Union[int, float]) == 5
 
 
+def test_union_converter_member_order():
+    # members are tried first to last, even when the outcome depends on
+    # the value and not just its type.
+    assert konfi.convert_value(5.0, Union[int, str]) == 5
+    assert konfi.convert_value(float("nan"), Union[int, str]) == "nan"
+    assert konfi.convert_value(5.0, Union[int, str]) == 5
+
+
 def test_tuple_converter():
     assert konfi.convert_value([1, 2], Tuple[int, ...]) == (1, 2)
     assert konfi.convert_value([1, 2], Tuple[int, int]) == (1, 2)
@@ -51,15 +59,15 @@ def test_enum_converter():
     assert converter.convert_value(5, MyEnum) == MyEnum.TRYHARD
 
 
-TESTS = [
+TESTS = (
     ("4", int, 4),
     ("4", float, 4.),
 
     ("3", Iterable[int], [3]),
     ([5, 3, 2], Set[str], {"2", "3", "5"}),
 
-    ({"test": 5}, Mapping[str, str], {"test": "5"})
-]
+    ({"test": 5}, Mapping[str, str], {"test": "5"}),
+)
 
 
 @pytest.mark.parametrize("inp,typ,expected", TESTS)
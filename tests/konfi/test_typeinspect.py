@@ -75,14 +75,14 @@ def test_has_type_special() -> None:
     assert not typeinspect.has_type((1, "a"), Tuple[int, ...])
 
 
-TESTS = [
+TESTS = (
     (("lol",), Any),
     ((1, "a"), Tuple[int, str]),
     ((1, "a"), Tuple[Union[int, str], ...]),
     ((1, 2), Tuple[int, ...]),
     (["1", "string", "3"], List[str]),
     ([1, "string", 3], List[Union[int, str]]),
-]
+)
 
 
 @pytest.mark.parametrize("val,typ", TESTS)